@@ -34,7 +34,12 @@ import time
 import uuid
 from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Dict, Generator, Iterable, List, Optional
+from typing import Callable, Deque, Dict, Generator, Iterable, List, Optional
+
+#: Shared encoder for outbound commands.  ``json.dumps`` builds a fresh
+#: :class:`json.JSONEncoder` whenever non-default separators are requested, so
+#: the compact encoder is constructed once at import time instead.
+_COMMAND_ENCODER = json.JSONEncoder(separators=(",", ":"))
 
 
 @dataclass
@@ -77,6 +82,10 @@ class CodexGodotProcessManager:
     banner_timeout:
         Maximum number of seconds to wait for the banner response that is
         negotiated automatically when the session starts.
+    clock:
+        Monotonic time source used for deadlines and heartbeat bookkeeping.
+        Defaults to :func:`time.monotonic`; tests may inject a fake clock so
+        timeout branches fire deterministically without real sleeping.
     """
 
     #: Method invoked automatically to negotiate a banner for Codex sessions.
@@ -93,6 +102,7 @@ class CodexGodotProcessManager:
         heartbeat_interval: Optional[float] = None,
         heartbeat_timeout: Optional[float] = None,
         banner_timeout: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self.godot_binary = godot_binary or os.environ.get("CODEX_GODOT_BIN")
         self.project_root = project_root or os.environ.get("CODEX_PROJECT_ROOT")
@@ -112,6 +122,7 @@ class CodexGodotProcessManager:
             heartbeat_timeout if heartbeat_timeout is not None else heartbeat_interval
         )
         self.banner_timeout = banner_timeout
+        self._clock = clock
 
         self._process: Optional[subprocess.Popen[str]] = None
         self._stdout_thread: Optional[threading.Thread] = None
@@ -124,7 +135,7 @@ class CodexGodotProcessManager:
         self._banner_request_id: Optional[int] = None
         self._banner: Optional[dict] = None
         self._session_id = str(uuid.uuid4())
-        self._last_activity = time.monotonic()
+        self._last_activity = self._clock()
         self._pending_messages: Deque[dict] = deque()
         self._pending_lock = threading.Lock()
 
@@ -176,7 +187,7 @@ class CodexGodotProcessManager:
         if timeout is not None and timeout < 0:
             raise ValueError("timeout must be non-negative")
 
-        deadline = time.monotonic() + timeout if timeout is not None else None
+        deadline = self._clock() + timeout if timeout is not None else None
 
         while True:
             return_code = process.poll()
@@ -184,7 +195,7 @@ class CodexGodotProcessManager:
                 return return_code
 
             if deadline is not None:
-                remaining = deadline - time.monotonic()
+                remaining = deadline - self._clock()
                 if remaining <= 0:
                     raise TimeoutError("Timed out waiting for Godot process to exit")
                 step = min(self._WAIT_POLL_INTERVAL, remaining)
@@ -340,14 +351,14 @@ class CodexGodotProcessManager:
             raise RuntimeError("Godot process is not running.")
 
         timeout = self.banner_timeout if timeout is None else timeout
-        start_time = time.monotonic()
+        start_time = self._clock()
         deadline = start_time + timeout if timeout is not None else None
         buffered_messages: List[dict] = []
 
         while self._banner_request_id is not None:
             remaining = None
             if deadline is not None:
-                remaining = deadline - time.monotonic()
+                remaining = deadline - self._clock()
                 if remaining <= 0:
                     break
 
@@ -378,7 +389,7 @@ class CodexGodotProcessManager:
                 self._pending_messages.extend(buffered_messages)
 
         if self._banner_request_id is not None:
-            elapsed = time.monotonic() - start_time
+            elapsed = self._clock() - start_time
             diagnostic = {
                 "timestamp": time.time(),
                 "stream": "banner",
@@ -416,7 +427,7 @@ class CodexGodotProcessManager:
             "method": method,
             "params": params or {},
         }
-        message = json.dumps(payload, separators=(",", ":")) + "\n"
+        message = _COMMAND_ENCODER.encode(payload) + "\n"
         try:
             self._process.stdin.write(message)
             self._process.stdin.flush()
@@ -510,7 +521,7 @@ class CodexGodotProcessManager:
     def _maybe_emit_heartbeat_timeout(self) -> None:
         if not self.heartbeat_timeout:
             return
-        elapsed = time.monotonic() - self._last_activity
+        elapsed = self._clock() - self._last_activity
         if elapsed < self.heartbeat_timeout:
             return
         diagnostic = {
@@ -521,7 +532,7 @@ class CodexGodotProcessManager:
             "session": self._session_id,
         }
         self._stderr_queue.put(diagnostic)
-        self._last_activity = time.monotonic()
+        self._last_activity = self._clock()
 
     def _consume_stdout_line(self, line: str) -> Optional[dict]:
         stripped = line.strip()
@@ -541,7 +552,7 @@ class CodexGodotProcessManager:
             )
             return None
 
-        self._last_activity = time.monotonic()
+        self._last_activity = self._clock()
 
         if self._banner_request_id is not None and message.get("id") == self._banner_request_id:
             banner_payload = message.get("result")